@@ -3,7 +3,8 @@
 Analyze a markdown knowledge repository to inform skill design.
 
 Usage:
-  python analyze_knowledge_repo.py <repo-path> [--output <report-path>]
+  python analyze_knowledge_repo.py <repo-path> [--output <report-path>] [--max-file-bytes <n>]
+                                   [--exclude <dir-name> ...]
 
 Output:
   - Content structure analysis
@@ -15,19 +16,72 @@ Output:
 Examples:
   python analyze_knowledge_repo.py ~/docs/dao-frameworks
   python analyze_knowledge_repo.py ./knowledge-garden --output ./analysis.md
+  python analyze_knowledge_repo.py ./site --exclude dist --exclude vendor
 """
 
 import argparse
+import io
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from collections import defaultdict, Counter
-import yaml
 
+# Repositories with fewer markdown files than this are analyzed in-process;
+# for them, worker start-up costs more than the analysis itself.
+PARALLEL_MIN_FILES = 64
 
-def analyze_repository(repo_path):
-    """Analyze markdown repository structure and content."""
+# Slice size for counting words, so content is never translated as one copy
+_COUNT_CHUNK_BYTES = 1 << 20
+
+# Maps the bytes str.split() treats as whitespace to b' ' and all others to
+# b'x', so every word starts at a b' x' pair. Multibyte Unicode spaces such
+# as U+00A0 count as word characters.
+_WORD_GAP_TABLE = bytes(0x20 if byte in b' \t\n\v\f\r\x1c\x1d\x1e\x1f' else 0x78 for byte in range(256))
+
+# Directory names never descended into; hidden directories (.git, .venv, ...)
+# are skipped as well. Extra names can be added with --exclude.
+DEFAULT_EXCLUDED_DIRS = frozenset({'node_modules', '__pycache__'})
+
+# Tags that mark a repository as framework/template content
+FRAMEWORK_TAGS = frozenset({'template', 'templates', 'framework', 'frameworks'})
+
+# Content is scanned as raw bytes and only captured spans are decoded. Bytes
+# patterns treat \w as ASCII, so tag runs also take any byte >= 0x80 (UTF-8
+# multibyte sequences); after decoding, _TAG_WORD_RE trims a run to its leading
+# Unicode word characters, so '#tag’s' or '#foo—bar' still yield 'tag'/'foo'.
+# Memory-mapped files are not newline-translated, so line ends may be \r\n.
+_FRONTMATTER_RE = re.compile(rb'---\r?\n(.*?)\r?\n---\r?\n', re.DOTALL)
+
+# Single-pass tokenizer for the body of a file. Headings and wikilinks are
+# matched through lookaheads so hashtags inside heading text or a link such as
+# [[Page#Section]] are still picked up.
+_TOKEN_RE = re.compile(
+    rb'^#{1,6}[ \t]+(?=(?P<heading>[^\r\n]+))'
+    rb'|#(?P<tag>[\w\x80-\xff]+)'
+    rb'|\[\[(?=(?P<wikilink>[^\]]+)\]\])'
+    rb'|(?P<fence>```)',
+    re.MULTILINE
+)
+
+_TAG_WORD_RE = re.compile(r'\w+')
+
+# Every token above starts with one of these literals. Searching for them with
+# find() is far faster than stepping the regex through plain prose, so the scan
+# starts at the first one (and is skipped when a file contains none).
+_TOKEN_LEADS = (b'#', b'[[', b'```')
+
+
+def analyze_repository(repo_path, max_file_bytes=None, exclude=()):
+    """Analyze markdown repository structure and content.
+
+    Files larger than max_file_bytes are memory-mapped instead of read.
+    Directories named in exclude are skipped in addition to
+    DEFAULT_EXCLUDED_DIRS and hidden directories.
+    """
 
     repo_path = Path(repo_path)
     if not repo_path.exists():
@@ -41,57 +95,130 @@ def analyze_repository(repo_path):
         'total_size': 0,
         'frontmatter_fields': Counter(),
         'tags': Counter(),
+        'top_tags': [],
         'wikilinks': [],
         'backlinks': defaultdict(list),
+        'backlink_counts': Counter(),
         'file_structure': {},
         'topics': [],
         'estimated_tokens': 0
     }
 
     # Scan all markdown files
-    md_files = list(repo_path.glob('**/*.md'))
-    analysis['total_files'] = len(md_files)
-
-    for md_file in md_files:
-        file_info = analyze_file(md_file, repo_path)
+    jobs = []
+    directory_counts = Counter()
+    excluded_dirs = DEFAULT_EXCLUDED_DIRS.union(exclude)
+    for rel_dir, name, file_path in walk_markdown_files(repo_path, excluded_dirs):
+        directory_counts[rel_dir] += 1
+        relative_path = f"{rel_dir}/{name}" if rel_dir else name
+        jobs.append((file_path, relative_path, max_file_bytes))
+    analysis['total_files'] = len(jobs)
+
+    backlinks = analysis['backlinks']
+    for file_info in _map_analyze_file(jobs):
         analysis['files'].append(file_info)
         analysis['total_size'] += file_info['size']
         analysis['estimated_tokens'] += file_info['estimated_tokens']
 
         # Aggregate frontmatter fields
-        for field in file_info['frontmatter'].keys():
-            analysis['frontmatter_fields'][field] += 1
+        analysis['frontmatter_fields'].update(file_info['frontmatter'].keys())
 
         # Aggregate tags
-        for tag in file_info['tags']:
-            analysis['tags'][tag] += 1
+        analysis['tags'].update(file_info['tags'])
 
         # Aggregate wikilinks
         analysis['wikilinks'].extend(file_info['wikilinks'])
 
         # Build backlink map
+        analysis['backlink_counts'].update(file_info['wikilinks'])
+        relative_path = file_info['relative_path']
         for link in file_info['wikilinks']:
-            analysis['backlinks'][link].append(file_info['relative_path'])
+            backlinks[link].append(relative_path)
 
     # Analyze structure
-    analysis['file_structure'] = build_directory_tree(md_files, repo_path)
+    analysis['file_structure'] = build_directory_tree(directory_counts)
 
     # Identify topics (from directory names and common tags)
-    analysis['topics'] = identify_topics(analysis)
+    analysis['top_tags'] = analysis['tags'].most_common(10)
+    analysis['topics'] = identify_topics(analysis, analysis['top_tags'])
 
     return analysis
 
 
-def analyze_file(file_path, repo_root):
+def walk_markdown_files(repo_path, excluded_dirs=DEFAULT_EXCLUDED_DIRS):
+    """Yield (relative directory, file name, file path) for markdown files below repo_path.
+
+    Hidden directories and those named in excluded_dirs are pruned without
+    being listed.
+    """
+
+    root = os.fspath(repo_path)
+    prefix_len = len(os.path.join(root, ''))
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in excluded_dirs]
+        rel_dir = dirpath[prefix_len:].replace(os.sep, '/')
+        for name in filenames:
+            if name.endswith('.md'):
+                yield rel_dir, name, os.path.join(dirpath, name)
+
+
+def _analyze_file_worker(job):
+    """Process pool entry point: unpack a (file path, relative path, max bytes) job."""
+
+    return analyze_file(*job)
+
+
+def _map_analyze_file(jobs):
+    """Yield analyze_file results for jobs, in order, fanning out to worker processes."""
+
+    if len(jobs) < PARALLEL_MIN_FILES:
+        yield from map(_analyze_file_worker, jobs)
+        return
+
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_analyze_file_worker, jobs, chunksize=32)
+
+
+def analyze_file(file_path, relative_path, max_file_bytes=None):
     """Analyze a single markdown file."""
 
-    content = file_path.read_text(encoding='utf-8', errors='ignore')
+    with open(file_path, 'rb') as f:
+        if max_file_bytes is not None and os.fstat(f.fileno()).st_size > max_file_bytes:
+            # Scan large files in place instead of copying them into memory
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return scan_content(data, file_path, relative_path)
+        data = f.read()
+
+    return scan_content(data, file_path, relative_path)
+
+
+def estimate_tokens(data):
+    """Rough estimate: ~1.3 tokens per whitespace-separated word."""
+
+    words = 0
+    after_gap = True
+    for start in range(0, len(data), _COUNT_CHUNK_BYTES):
+        chunk = data[start:start + _COUNT_CHUNK_BYTES].translate(_WORD_GAP_TABLE)
+        words += chunk.count(b' x') + (after_gap and chunk[:1] == b'x')
+        after_gap = chunk[-1:] == b' '
+    return words * 1.3
+
+
+def scan_content(data, file_path, relative_path):
+    """Extract file details from raw content (bytes or a read-only mmap)."""
+
+    size = len(data)
+    if not isinstance(data, mmap.mmap) and data.find(b'\r') != -1:
+        # Same universal-newline translation text-mode reads apply. Mappings
+        # are left as they are (copying them would defeat the mmap); the
+        # patterns accept \r\n line ends, but lone \r ones are not handled.
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
 
     file_info = {
-        'path': str(file_path),
-        'relative_path': str(file_path.relative_to(repo_root)),
-        'size': len(content),
-        'estimated_tokens': len(content.split()) * 1.3,  # Rough estimate
+        'path': file_path,
+        'relative_path': relative_path,
+        'size': size,
+        'estimated_tokens': estimate_tokens(data),
         'frontmatter': {},
         'tags': [],
         'wikilinks': [],
@@ -100,12 +227,11 @@ def analyze_file(file_path, repo_root):
     }
 
     # Parse frontmatter
-    frontmatter_match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
+    frontmatter_match = _FRONTMATTER_RE.match(data) if data[:4] == b'---\n' or data[:5] == b'---\r\n' else None
     if frontmatter_match:
-        try:
-            file_info['frontmatter'] = yaml.safe_load(frontmatter_match.group(1)) or {}
-        except yaml.YAMLError:
-            file_info['frontmatter'] = {}
+        frontmatter_block = frontmatter_match.group(1)
+        if frontmatter_block.strip():
+            file_info['frontmatter'] = load_frontmatter(frontmatter_block.decode('utf-8', 'ignore'))
 
     # Extract tags from frontmatter
     if 'tags' in file_info['frontmatter']:
@@ -115,55 +241,76 @@ def analyze_file(file_path, repo_root):
         elif isinstance(tags, str):
             file_info['tags'].append(tags)
 
-    # Extract hashtags from content
-    hashtags = re.findall(r'#(\w+)', content)
-    file_info['tags'].extend(hashtags)
+    # Extract hashtags, wikilinks, headings and code fences in one pass. The
+    # frontmatter is scanned too, so links in properties (up: "[[Index]]") count
+    wikilink_end = 0
+    for match in _TOKEN_RE.finditer(data, first_token_offset(data, 0)):
+        kind = match.lastgroup
+
+        if kind == 'fence':
+            file_info['has_code_blocks'] = True
+            continue
+
+        if kind == 'wikilink':
+            # A '[[' inside the previous link's text does not start another link
+            if match.start() < wikilink_end:
+                continue
+            wikilink_end = match.end(kind) + 2
+
+        value = match.group(kind).decode('utf-8', 'ignore')
+        if kind == 'tag':
+            word = _TAG_WORD_RE.match(value)
+            if word:
+                file_info['tags'].append(word.group())
+        elif kind == 'wikilink':
+            file_info['wikilinks'].append(value.replace('\r\n', '\n'))
+        else:
+            file_info['headings'].append(value)
+
+    return file_info
 
-    # Extract wikilinks
-    wikilinks = re.findall(r'\[\[([^\]]+)\]\]', content)
-    file_info['wikilinks'] = wikilinks
 
-    # Extract headings
-    headings = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
-    file_info['headings'] = headings
+def first_token_offset(data, start):
+    """Return the offset of the first possible token at or after start, or len(data)."""
 
-    # Check for code blocks
-    file_info['has_code_blocks'] = bool(re.search(r'```', content))
+    offsets = [offset for offset in (data.find(lead, start) for lead in _TOKEN_LEADS) if offset != -1]
+    return min(offsets, default=len(data))
 
-    return file_info
 
+def load_frontmatter(text):
+    """Parse a YAML frontmatter block, returning {} if it is empty or invalid."""
 
-def build_directory_tree(files, repo_root):
-    """Build a tree structure of directories and file counts."""
+    # Imported on first use so runs without frontmatter (and --help) skip PyYAML
+    import yaml
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader) or {}
+    except yaml.YAMLError:
+        return {}
 
-    tree = defaultdict(int)
-    for file_path in files:
-        relative = file_path.relative_to(repo_root)
-        if len(relative.parts) > 1:
-            directory = str(relative.parent)
-            tree[directory] += 1
-        else:
-            tree['root'] += 1
 
-    return dict(tree)
+def build_directory_tree(directory_counts):
+    """Build a tree structure of directories and file counts.
 
+    Takes the per-directory file counts gathered during the walk, keyed by
+    relative directory with '' standing for the repository root.
+    """
 
-def identify_topics(analysis):
-    """Identify main topics from directory names and common tags."""
+    return {directory or 'root': count for directory, count in directory_counts.items()}
 
-    topics = []
+
+def identify_topics(analysis, top_tags):
+    """Identify main topics from directory names and the most common tags."""
 
     # Topics from directory names
-    for directory in analysis['file_structure'].keys():
-        if directory != 'root':
-            topics.append(directory.split('/')[0])
+    topics = [directory.split('/')[0] for directory in analysis['file_structure'] if directory != 'root']
 
     # Topics from most common tags
-    for tag, count in analysis['tags'].most_common(10):
-        if tag not in topics:
-            topics.append(tag)
+    topics.extend(tag for tag, count in top_tags)
 
-    return list(set(topics))
+    # Deduplicate in first-seen order so the report lists topics deterministically
+    return list(dict.fromkeys(topics))
 
 
 def estimate_loading_strategy(analysis):
@@ -181,112 +328,139 @@ def estimate_loading_strategy(analysis):
 
 
 def generate_report(analysis, output_path=None):
-    """Generate analysis report in markdown format."""
+    """Generate analysis report in markdown format.
+
+    With output_path the report is streamed to that file section by section;
+    otherwise it is printed to stdout.
+    """
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as out:
+            write_report(analysis, out.write)
+        print(f"Analysis report written to: {output_path}")
+    else:
+        out = io.StringIO()
+        write_report(analysis, out.write)
+        print(out.getvalue())
+
+
+def write_report(analysis, write):
+    """Write the markdown report for analysis through the write callable."""
 
     loading_strategy, strategy_note = estimate_loading_strategy(analysis)
 
-    report = f"""# Knowledge Repository Analysis
+    # Derived figures used across sections
+    total_files = analysis['total_files']
+    estimated_tokens = analysis['estimated_tokens']
+    total_tokens = int(estimated_tokens)
+    per_file_tokens = int(estimated_tokens / total_files) if total_files else 0
+    multi_doc_tokens = int(estimated_tokens / total_files * 3) if total_files else 0
+    wikilink_count = len(analysis['wikilinks'])
+    topics = analysis['topics']
+    topic_summary = ', '.join(topics[:3])
+    primary_topic = topics[0] if topics else 'relevant topics'
+
+    # Recommend skill type based on content
+    lower_tags = {str(tag).lower() for tag in analysis['tags']}
+    if not FRAMEWORK_TAGS.isdisjoint(lower_tags):
+        skill_type = 'framework-guidance'
+        skill_type_note = "Repository appears to contain frameworks or templates. Consider creating a framework-guidance skill."
+    else:
+        skill_type = 'knowledge-retrieval'
+        skill_type_note = "Repository appears to be general knowledge content. Consider creating a knowledge-retrieval skill."
+
+    write(f"""# Knowledge Repository Analysis
 
 **Repository**: `{analysis['path']}`
-**Analysis Date**: {__import__('datetime').datetime.now().strftime('%Y-%m-%d')}
+**Analysis Date**: {datetime.now().strftime('%Y-%m-%d')}
 
 ## Summary
 
-- **Total Files**: {analysis['total_files']} markdown documents
+- **Total Files**: {total_files} markdown documents
 - **Total Size**: {analysis['total_size']:,} bytes
-- **Estimated Tokens**: ~{int(analysis['estimated_tokens']):,} tokens
-- **Topics Identified**: {len(analysis['topics'])}
+- **Estimated Tokens**: ~{total_tokens:,} tokens
+- **Topics Identified**: {len(topics)}
 - **Unique Tags**: {len(analysis['tags'])}
-- **Wikilinks Found**: {len(analysis['wikilinks'])}
+- **Wikilinks Found**: {wikilink_count}
 
 ## Repository Structure
 
 ### Directory Organization
 
-"""
+""")
 
     for directory, count in sorted(analysis['file_structure'].items()):
-        report += f"- `{directory}`: {count} files\n"
+        write(f"- `{directory}`: {count} files\n")
 
-    report += f"""
+    write("""
 
 ### Main Topics
 
 Based on directory names and common tags:
 
-"""
+""")
 
-    for topic in analysis['topics'][:10]:
-        report += f"- {topic}\n"
+    for topic in topics[:10]:
+        write(f"- {topic}\n")
 
-    report += f"""
+    write("""
 
 ## Content Patterns
 
 ### Frontmatter Usage
 
-"""
+""")
 
     if analysis['frontmatter_fields']:
-        report += "Common frontmatter fields:\n\n"
+        write("Common frontmatter fields:\n\n")
+        inv_total = 100.0 / (total_files or 1)
         for field, count in analysis['frontmatter_fields'].most_common(10):
-            percentage = (count / analysis['total_files']) * 100
-            report += f"- `{field}`: {count} files ({percentage:.0f}%)\n"
+            write(f"- `{field}`: {count} files ({count * inv_total:.0f}%)\n")
     else:
-        report += "No YAML frontmatter detected\n"
+        write("No YAML frontmatter detected\n")
 
-    report += f"""
+    write("""
 
 ### Tag Distribution
 
-"""
+""")
 
     if analysis['tags']:
-        report += "Most common tags:\n\n"
-        for tag, count in analysis['tags'].most_common(10):
-            report += f"- `#{tag}`: {count} occurrences\n"
+        write("Most common tags:\n\n")
+        for tag, count in analysis['top_tags']:
+            write(f"- `#{tag}`: {count} occurrences\n")
     else:
-        report += "No tags detected\n"
+        write("No tags detected\n")
 
-    report += f"""
+    write("""
 
 ### Linking Patterns
 
-"""
+""")
 
-    wikilink_count = len(analysis['wikilinks'])
     if wikilink_count > 0:
-        report += f"- **Total wikilinks**: {wikilink_count}\n"
-        report += f"- **Average per file**: {wikilink_count / analysis['total_files']:.1f}\n"
+        write(f"""- **Total wikilinks**: {wikilink_count}
+- **Average per file**: {wikilink_count / total_files:.1f}
+""")
 
         # Most linked-to pages
-        if analysis['backlinks']:
-            report += "\nMost referenced pages:\n\n"
-            sorted_backlinks = sorted(analysis['backlinks'].items(), key=lambda x: len(x[1]), reverse=True)
-            for page, references in sorted_backlinks[:5]:
-                report += f"- `{page}`: {len(references)} references\n"
+        if analysis['backlink_counts']:
+            write("\nMost referenced pages:\n\n")
+            for page, reference_count in analysis['backlink_counts'].most_common(5):
+                write(f"- `{page}`: {reference_count} references\n")
     else:
-        report += "No wikilinks detected\n"
+        write("No wikilinks detected\n")
 
-    report += f"""
+    write(f"""
 
 ## Recommended Skill Configuration
 
 ### Skill Type
 
-"""
+**Recommended**: `{skill_type}`
 
-    # Recommend skill type based on content
-    if 'template' in str(analysis['tags']).lower() or 'framework' in str(analysis['tags']).lower():
-        skill_type = 'framework-guidance'
-        report += f"**Recommended**: `{skill_type}`\n\n"
-        report += "Repository appears to contain frameworks or templates. Consider creating a framework-guidance skill.\n"
-    else:
-        skill_type = 'knowledge-retrieval'
-        report += f"**Recommended**: `{skill_type}`\n\n"
-        report += "Repository appears to be general knowledge content. Consider creating a knowledge-retrieval skill.\n"
+{skill_type_note}
 
-    report += f"""
 
 ### Loading Strategy
 
@@ -294,14 +468,14 @@ Based on directory names and common tags:
 
 {strategy_note}
 
-"""
+""")
 
     if loading_strategy == 'selective':
-        report += "\nSuggested trigger keywords:\n\n"
-        for topic in analysis['topics'][:5]:
-            report += f"- {topic}\n"
+        write("\nSuggested trigger keywords:\n\n")
+        for topic in topics[:5]:
+            write(f"- {topic}\n")
 
-    report += f"""
+    write(f"""
 
 ### Token Budget Estimates
 
@@ -312,9 +486,9 @@ Based on repository size and structure:
 | Skill metadata | ~100 | Name + description |
 | SKILL.md body | ~2000-2500 | Core capabilities and patterns |
 | Quick reference | ~500-1000 | Common patterns extracted |
-| Single doc lookup | ~{int(analysis['estimated_tokens'] / analysis['total_files']):.0f} | Average per file |
-| Multi-doc synthesis | ~{int(analysis['estimated_tokens'] / analysis['total_files'] * 3):.0f} | 3 files combined |
-| Full knowledge base | ~{int(analysis['estimated_tokens']):,} | All content (use on-demand) |
+| Single doc lookup | ~{per_file_tokens} | Average per file |
+| Multi-doc synthesis | ~{multi_doc_tokens} | 3 files combined |
+| Full knowledge base | ~{total_tokens:,} | All content (use on-demand) |
 
 ### Suggested Structure
 
@@ -324,12 +498,12 @@ skill-name/
 ├── scripts/
 ├── references/
 │   ├── quick-reference.md      # Top patterns/concepts (~500-1000 tokens)
-"""
+""")
 
-    for topic in analysis['topics'][:3]:
-        report += f"│   ├── {topic.lower().replace(' ', '-')}.md\n"
+    for topic in topics[:3]:
+        write(f"│   ├── {topic.lower().replace(' ', '-')}.md\n")
 
-    report += """└── assets/
+    write(f"""└── assets/
     └── templates/              # If framework-guidance type
 ```
 
@@ -347,7 +521,7 @@ skill-name/
 ```yaml
 ---
 name: [your-skill-name]
-description: [Brief description mentioning {', '.join(analysis['topics'][:3])}. Use when users ask about {analysis['topics'][0] if analysis['topics'] else 'relevant topics'}.]
+description: [Brief description mentioning {topic_summary}. Use when users ask about {primary_topic}.]
 ---
 ```
 
@@ -357,19 +531,11 @@ description: [Brief description mentioning {', '.join(analysis['topics'][:3])}.
 
 Top 10 largest files by estimated token count:
 
-"""
+""")
 
     sorted_files = sorted(analysis['files'], key=lambda x: x['estimated_tokens'], reverse=True)
     for i, file_info in enumerate(sorted_files[:10], 1):
-        report += f"{i}. `{file_info['relative_path']}`: ~{int(file_info['estimated_tokens']):,} tokens\n"
-
-    if output_path:
-        Path(output_path).write_text(report)
-        print(f"Analysis report written to: {output_path}")
-    else:
-        print(report)
-
-    return report
+        write(f"{i}. `{file_info['relative_path']}`: ~{int(file_info['estimated_tokens']):,} tokens\n")
 
 
 def main():
@@ -380,10 +546,18 @@ def main():
     )
     parser.add_argument('repo_path', help='Path to markdown knowledge repository')
     parser.add_argument('--output', '-o', help='Output path for analysis report (markdown file)')
+    parser.add_argument('--max-file-bytes', type=int, metavar='N',
+                        help='Memory-map files larger than N bytes instead of reading them into memory '
+                             '(mapped files handle \\n and \\r\\n line ends, but not old Mac-style \\r)')
+    parser.add_argument('--exclude', action='append', default=[], metavar='DIR',
+                        help='Directory name to skip (repeatable; hidden directories, '
+                             'node_modules and __pycache__ are always skipped)')
 
     args = parser.parse_args()
+    if args.max_file_bytes is not None and args.max_file_bytes < 0:
+        parser.error('--max-file-bytes must be zero or more')
 
-    analysis = analyze_repository(args.repo_path)
+    analysis = analyze_repository(args.repo_path, args.max_file_bytes, args.exclude)
     if analysis:
         generate_report(analysis, args.output)
     else:
@@ -3,7 +3,7 @@
 Package a skill into distributable ZIP archive.
 
 Usage:
-  python package_skill.py <skill-path> [--output <output-dir>]
+  python package_skill.py <skill-path> [--output <output-dir>] [--verbose]
 
 Validates:
   - SKILL.md exists with valid frontmatter
@@ -20,10 +20,15 @@ import argparse
 import os
 import subprocess
 import sys
+import traceback
 from pathlib import Path
 import zipfile
 
 
+# Already-compressed formats gain nothing from deflate; store them as-is
+STORED_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.zip', '.gz', '.woff', '.woff2')
+
+
 def validate_skill(skill_path):
     """Run validation checks before packaging."""
 
@@ -39,31 +44,83 @@ def validate_skill(skill_path):
     print("Running validation checks...\n")
 
     try:
-        result = subprocess.run(
-            [sys.executable, str(validate_script), str(skill_path)],
-            capture_output=True,
-            text=True
-        )
-
-        # Print validation output
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-
-        if result.returncode != 0:
-            print("\n❌ Skill validation failed. Please fix errors before packaging.")
-            return False
+        validator = _import_validator(script_dir)
+        valid = validator.validate(skill_path) if validator is not None else None
+    except Exception:
+        # A validator that fails to load (other than ImportError) or crashes
+        # fails validation, just as its non-zero exit status does when run
+        # as a subprocess
+        traceback.print_exc()
+        valid = False
+
+    if valid is None:
+        try:
+            valid = _run_validator_subprocess(validate_script, skill_path)
+        except Exception as e:
+            print(f"Error running validation: {e}")
+            print("Continuing with packaging anyway...\n")
+            return True
+
+    if not valid:
+        print("\n❌ Skill validation failed. Please fix errors before packaging.")
+        return False
 
-        return True
+    return True
 
-    except Exception as e:
-        print(f"Error running validation: {e}")
-        print("Continuing with packaging anyway...\n")
-        return True
+
+def _import_validator(script_dir):
+    """Import validate_skill.py from script_dir, or return None if it cannot be imported."""
+
+    if str(script_dir) not in sys.path:
+        sys.path.insert(0, str(script_dir))
+
+    try:
+        import validate_skill as validator
+    except ImportError:
+        return None
+    return validator
 
 
-def package_skill(skill_path, output_dir=None):
-    """Create ZIP archive of skill."""
+def _run_validator_subprocess(validate_script, skill_path):
+    """Run validate_skill.py in a separate interpreter and replay its output."""
+
+    result = subprocess.run(
+        [sys.executable, str(validate_script), str(skill_path)],
+        capture_output=True,
+        text=True
+    )
+
+    # Print validation output
+    print(result.stdout)
+    if result.stderr:
+        print(result.stderr)
+
+    return result.returncode == 0
+
+
+def walk_skill_files(root):
+    """Yield an os.DirEntry for every file below root that belongs in the package.
+
+    Hidden entries and __pycache__ directories are pruned where they are found,
+    so their contents are never listed. Compiled .pyc/.pyo files are skipped.
+    Symlinked files are included; symlinked directories are not followed.
+    """
+
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or name == '__pycache__':
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and not name.endswith(('.pyc', '.pyo')):
+                    yield entry
+
+
+def package_skill(skill_path, output_dir=None, verbose=False):
+    """Create ZIP archive of skill, listing each added file when verbose."""
 
     skill_path = Path(skill_path)
     if not skill_path.exists():
@@ -96,41 +153,54 @@ def package_skill(skill_path, output_dir=None):
             print("Packaging cancelled.")
             return False
 
-    print(f"\nPackaging skill: {skill_name}")
-    print(f"Source: {skill_path}")
-    print(f"Output: {zip_path}\n")
+    sys.stdout.write(f"\nPackaging skill: {skill_name}\nSource: {skill_path}\nOutput: {zip_path}\n")
+    if verbose:
+        print()
 
     # Create ZIP archive
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add all files in skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Skip certain files
-                    if any(part.startswith('.') for part in file_path.parts):
-                        continue
-                    if file_path.suffix in ['.pyc', '.pyo']:
-                        continue
-                    if '__pycache__' in str(file_path):
-                        continue
-
-                    # Add file to archive with relative path
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
+        # Skills are mostly small text files, where level 1 deflates far faster
+        # than the default level 6 at a modest size cost
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            # Add all files in skill directory. Walked paths all start with the
+            # skill path, so archive names are derived by slicing that prefix off.
+            root_prefix = os.path.join(os.fspath(skill_path), '')
+            prefix_len = len(root_prefix)
+            arc_prefix = os.path.join(skill_name, '') if skill_name else ''
+            file_count = 0
+            for entry in walk_skill_files(skill_path):
+                # Add file to archive with relative path
+                path = entry.path
+                if path.startswith(root_prefix):
+                    arcname = arc_prefix + path[prefix_len:]
+                else:
+                    arcname = os.path.relpath(path, skill_path.parent)
+                if entry.name.lower().endswith(STORED_SUFFIXES):
+                    zipf.write(path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.write(path, arcname)
+                file_count += 1
+                if verbose:
                     print(f"  Adding: {arcname}")
 
         # Get final size
         zip_size = zip_path.stat().st_size
-        print(f"\n✓ Skill packaged successfully!")
-        print(f"  Archive: {zip_path}")
-        print(f"  Size: {zip_size:,} bytes ({zip_size / 1024:.1f} KB)")
-
-        # Print installation instructions
-        print(f"\nTo install this skill:")
-        print(f"  1. Extract {zip_path.name}")
-        print(f"  2. Move to skills directory in a plugin")
-        print(f"  3. Add to plugin.json skills array")
-        print(f"  4. Install plugin via Claude Code\n")
+        lines = [
+            "",
+            "✓ Skill packaged successfully!",
+            f"  Archive: {zip_path}",
+            f"  Files: {file_count}",
+            f"  Size: {zip_size:,} bytes ({zip_size / 1024:.1f} KB)",
+            "",
+            # Installation instructions
+            "To install this skill:",
+            f"  1. Extract {zip_path.name}",
+            "  2. Move to skills directory in a plugin",
+            "  3. Add to plugin.json skills array",
+            "  4. Install plugin via Claude Code",
+            "",
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         return True
 
@@ -149,6 +219,8 @@ def main():
     parser.add_argument('--output', '-o', help='Output directory for ZIP file (default: current directory)')
     parser.add_argument('--skip-validation', action='store_true',
                         help='Skip validation checks (not recommended)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='List each file as it is added to the archive')
 
     args = parser.parse_args()
 
@@ -158,7 +230,7 @@ def main():
             sys.exit(1)
 
     # Package skill
-    if not package_skill(args.skill_path, args.output):
+    if not package_skill(args.skill_path, args.output, args.verbose):
         sys.exit(1)
 
 
@@ -3,7 +3,7 @@
 Validate skill structure and content against official requirements.
 
 Usage:
-  python validate_skill.py <skill-path>
+  python validate_skill.py <skill-path> [<skill-path> ...] [--frontmatter-only]
 
 Checks:
   - SKILL.md exists with valid YAML frontmatter
@@ -17,74 +17,244 @@ Checks:
 Examples:
   python validate_skill.py ./my-skill
   python validate_skill.py ../skills/dao-knowledge
+  python validate_skill.py ../skills/*
+  python validate_skill.py --frontmatter-only ../skills/*
 """
 
 import argparse
+import itertools
+import mmap
 import os
 import re
 import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import yaml
 
 
+# Fewer skills than this are validated in-process; for them, worker
+# start-up costs more than the validation itself.
+PARALLEL_MIN_SKILLS = 8
+
+# Results of the SKILL.md-only checks, keyed by (resolved skill path, SKILL.md
+# mtime_ns, SKILL.md size), so long-running callers skip unchanged files.
+# Least recently used entries are dropped beyond REPORT_CACHE_SIZE.
+REPORT_CACHE_SIZE = 128
+_REPORT_CACHE = OrderedDict()
+
+# libyaml's C loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_NAME_ALLOWED = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
+
+# One pass over the SKILL.md body; each match is bucketed by its group name.
+# The leading lookahead lists every marker's first character, so positions
+# that cannot start one are rejected before any branch is tried.
+_CONTENT_MARKERS_RE = re.compile(
+    r'(?=[\[yYtT])'
+    r'(?:(?P<todo>\[TODO[:\]])'
+    r'|(?i:(?P<second_person>\byou(?:r| (?:should|must|can|will))\b)|(?P<token>token)))'
+)
+# Markdown header text, for the recommended-section checks
+_HEADER_RE = re.compile(r'^#+[ \t]+(.+?)[ \t]*$', re.MULTILINE)
+# Recommended SKILL.md body size; moving detail to references/ is suggested past it
+MAX_BODY_WORDS = 5000
+_WORD_RE = re.compile(r'\S+')
+_REF_RE = re.compile(r'`((?:scripts|references|assets)/[^`]+)`')
+
+
 class SkillValidator:
+    # Fixed attribute set: no per-instance __dict__ when validating many skills
+    __slots__ = (
+        'skill_path', 'errors', 'warnings', 'skill_md_path', 'frontmatter',
+        '_frontmatter_text', '_body_bytes', '_body', 'references',
+    )
+
     def __init__(self, skill_path):
         self.skill_path = Path(skill_path)
         self.errors = []
         self.warnings = []
         self.skill_md_path = self.skill_path / 'SKILL.md'
         self.frontmatter = {}
-        self.content = ''
+        self._frontmatter_text = ''
+        self._body_bytes = b''
+        self._body = None
+        self.references = None
 
-    def validate_all(self):
-        """Run all validation checks."""
+    def validate_all(self, frontmatter_only=False):
+        """Run all validation checks and print the report."""
 
         print(f"Validating skill at: {self.skill_path}\n")
 
-        self.check_skill_md_exists()
-        if self.skill_md_path.exists():
-            self.parse_skill_md()
-            self.check_frontmatter()
-            self.check_content()
-            self.check_directory_structure()
-            self.check_references()
+        self.run_checks(frontmatter_only)
 
         return self.report()
 
-    def check_skill_md_exists(self):
-        """Check that SKILL.md file exists."""
+    def run_checks(self, frontmatter_only=False):
+        """Run all validation checks, collecting errors and warnings without printing.
+
+        With frontmatter_only, only the name/description/allowed-tools checks run
+        and SKILL.md is read no further than its closing '---'.
+        """
 
-        if not self.skill_md_path.exists():
+        # No separate exists() probe: opening or stat-ing SKILL.md tells us
+        try:
+            if frontmatter_only:
+                self.parse_frontmatter_only()
+                self.check_frontmatter()
+                return
+            self.run_skill_md_checks()
+        except (FileNotFoundError, NotADirectoryError):
             self.errors.append(f"SKILL.md not found at {self.skill_md_path}")
-            return False
-        return True
+            return
+
+        # These depend on files besides SKILL.md, so they are never cached
+        self.check_directory_structure()
+        self.check_references()
+
+    def run_skill_md_checks(self):
+        """Parse SKILL.md and check its frontmatter and content, reusing cached results for an unchanged file.
+
+        Raises FileNotFoundError or NotADirectoryError if SKILL.md does not exist.
+        """
+
+        try:
+            st = self.skill_md_path.stat()
+            key = (str(self.skill_path.resolve()), st.st_mtime_ns, st.st_size)
+        except (FileNotFoundError, NotADirectoryError):
+            raise
+        except OSError:
+            key = None
+
+        cached = _REPORT_CACHE.get(key) if key is not None else None
+        if cached is not None:
+            _REPORT_CACHE.move_to_end(key)
+            errors, warnings, references = cached
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
+            self.references = list(references)
+            return
+
+        errors_before, warnings_before = len(self.errors), len(self.warnings)
+        self.parse_skill_md()
+        self.check_frontmatter()
+        self.check_content()
+        self.find_references()
+
+        if key is not None:
+            _REPORT_CACHE[key] = (
+                tuple(self.errors[errors_before:]),
+                tuple(self.warnings[warnings_before:]),
+                tuple(self.references),
+            )
+            while len(_REPORT_CACHE) > REPORT_CACHE_SIZE:
+                _REPORT_CACHE.popitem(last=False)
 
     def parse_skill_md(self):
         """Parse SKILL.md file and extract frontmatter."""
 
         try:
-            self.content = self.skill_md_path.read_text(encoding='utf-8')
+            with open(self.skill_md_path, 'rb') as f:
+                # mmap refuses zero-length files
+                if os.fstat(f.fileno()).st_size:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    mapped = None
         except Exception as e:
             self.errors.append(f"Could not read SKILL.md: {e}")
             return False
 
-        # Extract frontmatter
-        frontmatter_match = re.match(r'^---\n(.*?)\n---\n', self.content, re.DOTALL)
-        if not frontmatter_match:
+        # Extract frontmatter; only its bytes are decoded here, the body waits for check_content
+        data = mapped if mapped is not None else b''
+        try:
+            if data.find(b'\r') != -1:
+                # Same universal-newline translation text-mode reads apply
+                data = data[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            end = data.find(b'\n---\n', 4) if data[:4] == b'---\n' else -1
+            frontmatter_bytes = data[4:end] if end != -1 else None
+            self._body_bytes = data[end + 5:] if end != -1 else data[:]
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+        if frontmatter_bytes is None:
             self.errors.append("SKILL.md must begin with YAML frontmatter (---)")
             return False
+        try:
+            self._frontmatter_text = frontmatter_bytes.decode('utf-8')
+        except UnicodeDecodeError as e:
+            self.errors.append(f"Could not read SKILL.md: {e}")
+            return False
+
+        return self.load_frontmatter()
+
+    def parse_frontmatter_only(self):
+        """Read SKILL.md line by line up to the closing '---' and extract frontmatter.
+
+        Raises FileNotFoundError or NotADirectoryError if SKILL.md does not exist.
+        """
+
+        # Lines are read as bytes so that nothing past the frontmatter gets decoded
+        lines = []
+        closed = False
+        try:
+            with open(self.skill_md_path, 'rb') as f:
+                if f.readline().replace(b'\r\n', b'\n') == b'---\n':
+                    for line in f:
+                        line = line.replace(b'\r\n', b'\n')
+                        if line == b'---\n':
+                            closed = True
+                            break
+                        lines.append(line)
+        except (FileNotFoundError, NotADirectoryError):
+            raise
+        except Exception as e:
+            self.errors.append(f"Could not read SKILL.md: {e}")
+            return False
 
+        # Same rule as parse_skill_md: the block needs at least one line before '---'
+        if not closed or not lines:
+            self.errors.append("SKILL.md must begin with YAML frontmatter (---)")
+            return False
         try:
-            self.frontmatter = yaml.safe_load(frontmatter_match.group(1))
-            if not isinstance(self.frontmatter, dict):
+            self._frontmatter_text = b''.join(lines).decode('utf-8')
+        except UnicodeDecodeError as e:
+            self.errors.append(f"Could not read SKILL.md: {e}")
+            return False
+
+        return self.load_frontmatter()
+
+    def load_frontmatter(self):
+        """Parse the extracted frontmatter text as a YAML dictionary."""
+
+        try:
+            frontmatter = yaml.load(self._frontmatter_text, Loader=_SafeLoader)
+            if not isinstance(frontmatter, dict):
+                # Empty, scalar or list frontmatter: check_frontmatter then
+                # reports the required fields as missing
                 self.errors.append("Frontmatter must be a valid YAML dictionary")
                 return False
+            self.frontmatter = frontmatter
         except yaml.YAMLError as e:
             self.errors.append(f"Invalid YAML frontmatter: {e}")
             return False
 
         return True
 
+    @property
+    def body(self):
+        """SKILL.md content after the frontmatter, decoded on first use."""
+
+        if self._body is None:
+            try:
+                self._body = self._body_bytes.decode('utf-8')
+            except UnicodeDecodeError as e:
+                self.errors.append(f"Could not read SKILL.md: {e}")
+                self._body = ''
+            self._body_bytes = b''
+        return self._body
+
     def check_frontmatter(self):
         """Validate frontmatter fields."""
 
@@ -101,16 +271,16 @@ class SkillValidator:
             if not isinstance(name, str):
                 self.errors.append("Field 'name' must be a string")
             else:
+                # Check length first so oversized names are never scanned character by character
+                if len(name) > 64:
+                    self.errors.append(f"Field 'name' must be 64 characters or less (currently {len(name)})")
+
                 # Check format: lowercase, numbers, hyphens only
-                if not re.match(r'^[a-z0-9-]+$', name):
+                elif not name or not _NAME_ALLOWED.issuperset(name):
                     self.errors.append(
                         "Field 'name' must contain only lowercase letters, numbers, and hyphens"
                     )
 
-                # Check length
-                if len(name) > 64:
-                    self.errors.append(f"Field 'name' must be 64 characters or less (currently {len(name)})")
-
                 # Check for TODO placeholder
                 if 'todo' in name.lower():
                     self.warnings.append("Field 'name' appears to contain TODO placeholder")
@@ -145,42 +315,46 @@ class SkillValidator:
     def check_content(self):
         """Validate SKILL.md content."""
 
-        # Remove frontmatter for content checks
-        content_without_frontmatter = re.sub(r'^---\n.*?\n---\n', '', self.content, flags=re.DOTALL)
+        content_without_frontmatter = self.body
 
-        # Check word count (should be < 5000 words per guidelines)
-        word_count = len(content_without_frontmatter.split())
-        if word_count > 5000:
+        # Check word count (should be < 5000 words per guidelines). More than
+        # MAX_BODY_WORDS words need at least one separator each, so shorter
+        # bodies are not counted at all.
+        if len(content_without_frontmatter) > 2 * MAX_BODY_WORDS:
+            word_count = sum(1 for _ in _WORD_RE.finditer(content_without_frontmatter))
+        else:
+            word_count = 0
+        if word_count > MAX_BODY_WORDS:
             self.warnings.append(
-                f"SKILL.md body is {word_count} words (recommended: <5000 words). "
+                f"SKILL.md body is {word_count} words (recommended: <{MAX_BODY_WORDS} words). "
                 "Consider moving detailed content to references/"
             )
 
+        markers = Counter(m.lastgroup for m in _CONTENT_MARKERS_RE.finditer(content_without_frontmatter))
+
         # Check for TODO placeholders
-        todo_count = len(re.findall(r'\[TODO[:\]]', content_without_frontmatter))
+        todo_count = markers['todo']
         if todo_count > 0:
             self.warnings.append(f"Found {todo_count} TODO placeholder(s) in content")
 
         # Check for second-person language (should use imperative instead)
-        second_person = re.findall(
-            r'\b(you should|you must|you can|you will|your)\b',
-            content_without_frontmatter,
-            re.IGNORECASE
-        )
+        second_person = markers['second_person']
         if second_person:
             self.warnings.append(
-                f"Found {len(second_person)} instances of second-person language. "
+                f"Found {second_person} instances of second-person language. "
                 "Official guidelines recommend imperative form instead (e.g., 'To accomplish X, do Y')"
             )
 
-        # Check for key sections
+        # Check for key sections; they count only when named in a header
+        # (e.g. '## Core Capabilities'), not when mentioned in prose
+        headers = '\n'.join(m.group(1) for m in _HEADER_RE.finditer(content_without_frontmatter)).lower()
         required_sections = ['Purpose', 'Capabilities', 'Usage']
         for section in required_sections:
-            if section.lower() not in content_without_frontmatter.lower():
+            if section.lower() not in headers:
                 self.warnings.append(f"Recommended section '{section}' not found in content")
 
         # Check for token budget documentation
-        if 'token' not in content_without_frontmatter.lower():
+        if 'token' not in markers:
             self.warnings.append("No token budget documentation found (recommended for transparency)")
 
     def check_directory_structure(self):
@@ -188,7 +362,8 @@ class SkillValidator:
 
         # Check for optional but conventional directories
         conventional_dirs = ['scripts', 'references', 'assets']
-        existing_dirs = [d.name for d in self.skill_path.iterdir() if d.is_dir()]
+        with os.scandir(self.skill_path) as it:
+            existing_dirs = [entry.name for entry in it if entry.is_dir()]
 
         if not any(d in existing_dirs for d in conventional_dirs):
             self.warnings.append(
@@ -196,18 +371,30 @@ class SkillValidator:
                 "This is optional but recommended for better organization."
             )
 
-        # Check scripts are executable
-        scripts_dir = self.skill_path / 'scripts'
-        if scripts_dir.exists():
-            for script in scripts_dir.glob('*.py'):
-                if not os.access(script, os.X_OK):
-                    self.warnings.append(f"Script {script.name} is not executable")
+        # Check scripts are executable (any x bit in the cached DirEntry stat)
+        if 'scripts' in existing_dirs:
+            with os.scandir(self.skill_path / 'scripts') as it:
+                for entry in it:
+                    if not entry.name.endswith('.py'):
+                        continue
+                    try:
+                        executable = entry.stat().st_mode & 0o111
+                    except OSError:
+                        # e.g. a dangling symlink, which os.access also rejected
+                        executable = False
+                    if not executable:
+                        self.warnings.append(f"Script {entry.name} is not executable")
+
+    def find_references(self):
+        """Collect file references in SKILL.md (e.g., `references/file.md`, `scripts/script.py`)."""
+
+        self.references = _REF_RE.findall(self._frontmatter_text) + _REF_RE.findall(self.body)
+        return self.references
 
     def check_references(self):
         """Check that referenced files exist."""
 
-        # Find references in content (e.g., `references/file.md`, `scripts/script.py`)
-        references = re.findall(r'`((?:scripts|references|assets)/[^`]+)`', self.content)
+        references = self.references if self.references is not None else self.find_references()
 
         for ref in references:
             ref_path = self.skill_path / ref
@@ -217,29 +404,75 @@ class SkillValidator:
     def report(self):
         """Generate and print validation report."""
 
-        print("=" * 60)
-        print("VALIDATION REPORT")
-        print("=" * 60)
+        return print_report(self.errors, self.warnings)
+
 
-        if self.errors:
-            print("\n❌ ERRORS:")
-            for i, error in enumerate(self.errors, 1):
-                print(f"  {i}. {error}")
+def print_report(errors, warnings):
+    """Print a validation report for the given errors and warnings; return True if there are no errors."""
 
-        if self.warnings:
-            print("\n⚠️  WARNINGS:")
-            for i, warning in enumerate(self.warnings, 1):
-                print(f"  {i}. {warning}")
+    lines = ["=" * 60, "VALIDATION REPORT", "=" * 60]
 
-        if not self.errors and not self.warnings:
-            print("\n✓ All checks passed! Skill is valid.")
+    if errors:
+        lines.append("\n❌ ERRORS:")
+        lines.extend(f"  {i}. {error}" for i, error in enumerate(errors, 1))
 
-        print("\n" + "=" * 60)
-        print(f"Summary: {len(self.errors)} errors, {len(self.warnings)} warnings")
-        print("=" * 60)
+    if warnings:
+        lines.append("\n⚠️  WARNINGS:")
+        lines.extend(f"  {i}. {warning}" for i, warning in enumerate(warnings, 1))
 
-        # Return success if no errors
-        return len(self.errors) == 0
+    if not errors and not warnings:
+        lines.append("\n✓ All checks passed! Skill is valid.")
+
+    lines += [
+        "\n" + "=" * 60,
+        f"Summary: {len(errors)} errors, {len(warnings)} warnings",
+        "=" * 60,
+    ]
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+    # Return success if no errors
+    return len(errors) == 0
+
+
+def validate(skill_path):
+    """Validate the skill at skill_path and print the report; return True if it has no errors."""
+
+    return SkillValidator(skill_path).validate_all()
+
+
+def _run_one(skill_path, frontmatter_only=False):
+    """Process pool entry point: check one skill and return (path, errors, warnings)."""
+
+    validator = SkillValidator(skill_path)
+    try:
+        validator.run_checks(frontmatter_only)
+    except Exception as e:
+        # Recorded per skill, so one crash does not end the whole batch
+        validator.errors.append(f"Validation crashed: {type(e).__name__}: {e}")
+    return skill_path, validator.errors, validator.warnings
+
+
+def _map_run_one(skill_paths, frontmatter_only=False):
+    """Yield _run_one results for skill_paths, in order, fanning out to worker processes."""
+
+    flags = itertools.repeat(frontmatter_only)
+    if len(skill_paths) < PARALLEL_MIN_SKILLS:
+        yield from map(_run_one, skill_paths, flags)
+        return
+
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_run_one, skill_paths, flags, chunksize=8)
+
+
+def validate_many(skill_paths, frontmatter_only=False):
+    """Validate every skill in skill_paths and print their reports in order; return the paths that have errors."""
+
+    failed = []
+    for skill_path, errors, warnings in _map_run_one(skill_paths, frontmatter_only):
+        print(f"Validating skill at: {Path(skill_path)}\n")
+        if not print_report(errors, warnings):
+            failed.append(skill_path)
+    return failed
 
 
 def main():
@@ -248,14 +481,20 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
-    parser.add_argument('skill_path', help='Path to skill directory')
+    parser.add_argument('skill_paths', nargs='+', metavar='skill_path', help='Path to skill directory')
+    parser.add_argument('--frontmatter-only', action='store_true',
+                        help='Only check SKILL.md frontmatter fields (fast, e.g. for pre-commit hooks)')
 
     args = parser.parse_args()
 
-    validator = SkillValidator(args.skill_path)
-    success = validator.validate_all()
+    failed = validate_many(args.skill_paths, args.frontmatter_only)
+
+    if len(args.skill_paths) > 1:
+        print(f"\nValidated {len(args.skill_paths)} skills: {len(failed)} with errors")
+        for skill_path in failed:
+            print(f"  ❌ {skill_path}")
 
-    sys.exit(0 if success else 1)
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == '__main__':